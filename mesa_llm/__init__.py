@@ -3,6 +3,7 @@ import datetime
 import mesa_llm.tools.inbuilt_tools  # noqa: F401, to register inbuilt tools
 
 from .parallel_stepping import (
+    astep_all,
     enable_automatic_parallel_stepping,
     step_agents_parallel,
     step_agents_parallel_sync,
@@ -18,11 +19,10 @@ __all__ = [
     "Observation",
     "Plan",
     "ToolManager",
+    "astep_all",
     "enable_automatic_parallel_stepping",
     "record_model",
     "step_agents_parallel",
-    "step_agents_parallel",
-    "step_agents_parallel_sync",
     "step_agents_parallel_sync",
 ]
 
@@ -1,3 +1,5 @@
+from itertools import chain
+
 from mesa.agent import Agent
 from mesa.discrete_space import (
     OrthogonalMooreGrid,
@@ -65,6 +67,8 @@ class LLMAgent(Agent):
         self.system_prompt = system_prompt
         self.is_speaking = False
         self._current_plan = None  # Store current plan for formatting
+        self._obs_key_cache: tuple[int, str] | None = None
+        self._get_neighbors = None  # Neighbor-fetch function, bound on first use
 
         # display coordination
         self._step_display_data = {}
@@ -79,6 +83,19 @@ class LLMAgent(Agent):
     def __str__(self):
         return f"LLMAgent {self.unique_id}"
 
+    @property
+    def _obs_key(self) -> str:
+        """
+        The "<class name> <unique_id>" label used as key in observation
+        local_state dicts, cached so it is not rebuilt for every observer
+        every step.
+        """
+        cache = self._obs_key_cache
+        if cache is None or cache[0] != self.unique_id:
+            cache = (self.unique_id, f"{self.__class__.__name__} {self.unique_id}")
+            self._obs_key_cache = cache
+        return cache[1]
+
     def apply_plan(self, plan: Plan) -> list[dict]:
         """
         Execute the plan in the simulation.
@@ -104,6 +121,73 @@ class LLMAgent(Agent):
 
         return tool_call_resp
 
+    async def aapply_plan(self, plan: Plan) -> list[dict]:
+        """
+        Asynchronous version of apply_plan() that executes independent tool
+        calls of the plan concurrently.
+        """
+        # Store current plan for display
+        self._current_plan = plan
+
+        # Execute tool calls in parallel
+        tool_call_resp = await self.tool_manager.acall_tools(
+            agent=self, llm_response=plan.llm_plan
+        )
+
+        # Add to memory
+        self.memory.add_to_memory(
+            type="action",
+            content={
+                k: v
+                for tool_call in tool_call_resp
+                for k, v in tool_call.items()
+                if k not in ["tool_call_id", "role"]
+            },
+        )
+
+        return tool_call_resp
+
+    def _make_neighbor_fn(self):
+        """
+        Build the neighbor-fetch function for this agent once. The grid type is
+        fixed for the lifetime of the model, so the isinstance dispatch does
+        not belong on the per-step observation path.
+        """
+        grid = getattr(self.model, "grid", None)
+
+        if isinstance(grid, SingleGrid | MultiGrid):
+            return lambda pos: grid.get_neighbors(
+                tuple(pos), moore=True, include_center=False, radius=1
+            )
+
+        if isinstance(grid, OrthogonalMooreGrid | OrthogonalVonNeumannGrid):
+
+            def cell_neighbors(pos):
+                neighbors = []
+                for neighbor in self.cell.connections.values():
+                    neighbors.extend(neighbor.agents)
+                return neighbors
+
+            return cell_neighbors
+
+        if isinstance(getattr(self.model, "space", None), ContinuousSpace):
+            space = self.model.space
+
+            def radius_neighbors(pos):
+                # Vectorized radius query over the space's position array;
+                # include_center=True keeps co-located agents, so drop self
+                return [
+                    agent
+                    for agent in space.get_neighbors(
+                        tuple(pos), radius=self.vision, include_center=True
+                    )
+                    if agent is not self
+                ]
+
+            return radius_neighbors
+
+        return lambda pos: []
+
     def generate_obs(self) -> Observation:
         """
         Returns an instance of the Observation dataclass enlisting everything the agent can see in the model in that step.
@@ -115,37 +199,30 @@ class LLMAgent(Agent):
         """
         step = self.model.steps
 
+        # Resolve the position once; it is reused below and for neighbor lookup
+        pos = self.pos if self.pos is not None else self.cell.coordinate
+
         self_state = {
             "agent_unique_id": self.unique_id,
             "system_prompt": self.system_prompt,
-            "location": self.pos if self.pos is not None else self.cell.coordinate,
+            "location": pos,
             "internal_state": self.internal_state,
         }
         if self.vision is not None and self.vision > 0:
-            if isinstance(self.model.grid, SingleGrid | MultiGrid):
-                neighbors = self.model.grid.get_neighbors(
-                    tuple(self.pos), moore=True, include_center=False, radius=1
-                )
-            elif isinstance(
-                self.model.grid, OrthogonalMooreGrid | OrthogonalVonNeumannGrid
-            ):
-                neighbors = []
-                for neighbor in self.cell.connections.values():
-                    neighbors.extend(neighbor.agents)
-
-            elif isinstance(self.model.space, ContinuousSpace):
-                neighbors, _ = self.get_neighbors_in_radius(radius=self.vision)
+            if self._get_neighbors is None:
+                self._get_neighbors = self._make_neighbor_fn()
+            neighbors = self._get_neighbors(pos)
 
         elif self.vision == -1:
-            all_agents = list(self.model.agents)
-            neighbors = [agent for agent in all_agents if agent is not self]
+            # Iterate the AgentSet lazily instead of copying it per agent
+            neighbors = (agent for agent in self.model.agents if agent is not self)
 
         else:
             neighbors = []
 
         local_state = {}
         for i in neighbors:
-            local_state[i.__class__.__name__ + " " + str(i.unique_id)] = {
+            local_state[i._obs_key] = {
                 "position": i.pos if i.pos is not None else i.cell.coordinate,
                 "internal_state": [
                     s for s in i.internal_state if not s.startswith("_")
@@ -167,15 +244,15 @@ class LLMAgent(Agent):
         """
         Send a message to the recipients.
         """
-        for recipient in [*recipients, self]:
-            recipient.memory.add_to_memory(
-                type="message",
-                content={
-                    "message": message,
-                    "sender": self,
-                    "recipients": recipients,
-                },
-            )
+        # Build the content once and hand each recipient a shallow copy, since
+        # some memories (e.g. EpisodicMemory) mutate the dict they receive
+        content = {
+            "message": message,
+            "sender": self,
+            "recipients": recipients,
+        }
+        for recipient in chain(recipients, (self,)):
+            recipient.memory.add_to_memory(type="message", content=dict(content))
 
         return f"{self} → {recipients} : {message}"
 
@@ -1,5 +1,5 @@
-import json
 from collections import deque
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -14,6 +14,10 @@ class EventGrade(BaseModel):
     grade: int
 
 
+class EventGradeBatch(BaseModel):
+    grades: list[EventGrade]
+
+
 class EpisodicMemory(Memory):
     """
     Stores memories based on event importance scoring. Each new memory entry is evaluated by a LLM
@@ -44,6 +48,9 @@ class EpisodicMemory(Memory):
         self.memory_entries = deque(maxlen=self.max_capacity)
         self.considered_entries = considered_entries
 
+        # Memoized tail of the memory used as grading context
+        self._prev_entries_cache: tuple[tuple[int, int | None], str] | None = None
+
         self.system_prompt = """
             You are an assistant that evaluates memory entries on a scale from 1 to 5, based on their importance to a specific problem or task. Your goal is to assign a score that reflects how much each entry contributes to understanding, solving, or advancing the task. Use the following grading scale:
 
@@ -60,20 +67,85 @@ class EpisodicMemory(Memory):
             Only assess based on the entry's content and its value to the task at hand. Ignore style, grammar, or tone.
             """
 
+    def _format_previous_entries(self) -> str:
+        """
+        Format the last few memory entries as context for the grading prompt.
+        The joined string is memoized until the memory changes.
+        """
+        key = (
+            len(self.memory_entries),
+            id(self.memory_entries[-1]) if self.memory_entries else None,
+        )
+        if self._prev_entries_cache is not None and self._prev_entries_cache[0] == key:
+            return self._prev_entries_cache[1]
+
+        tail = list(
+            islice(
+                self.memory_entries,
+                max(0, len(self.memory_entries) - 5),
+                len(self.memory_entries),
+            )
+        )
+        formatted = (
+            "previous memory entries:\n\n".join(map(str, tail))
+            if tail
+            else "No previous memory entries"
+        )
+
+        self._prev_entries_cache = (key, formatted)
+        return formatted
+
+    def grade_events_importance(self, events: list[tuple[str, dict]]) -> list[int]:
+        """
+        Grade several events with a single LLM request instead of one request
+        per event.
+
+        Args:
+            events: A list of (type, content) pairs to grade.
+
+        Returns:
+            The importance grades, in the same order as the events.
+        """
+        numbered_events = "\n".join(
+            f"{i + 1}. {event_type}: {content}"
+            for i, (event_type, content) in enumerate(events)
+        )
+
+        prompt = f"""
+            grade the importance of each of the following events on a scale from 1 to 5,
+            returning one grade per event in the same order:
+            {numbered_events}
+            ------------------------------
+            {self._format_previous_entries()}
+            """
+
+        self.llm.system_prompt = self.system_prompt
+
+        rsp = self.agent.llm.generate(
+            prompt=prompt,
+            response_format=EventGradeBatch,
+        )
+
+        batch = EventGradeBatch.model_validate_json(rsp.choices[0].message.content)
+        return [grade.grade for grade in batch.grades]
+
+    def add_many_to_memory(self, entries: list[tuple[str, dict]]):
+        """
+        Add several memory entries at once, grading all of them in one LLM
+        request
+        """
+        grades = self.grade_events_importance(entries)
+        # strict: a miscounted grade list must fail loudly instead of
+        # silently dropping memory entries
+        for (entry_type, content), grade in zip(entries, grades, strict=True):
+            content["importance"] = grade
+            super().add_to_memory(entry_type, content)
+
     def grade_event_importance(self, type: str, content: dict) -> float:
         """
         Grade this event based on the content respect to the previous memory entries
         """
-        if len(self.memory_entries) in range(5):
-            previous_entries = "previous memory entries:\n\n".join(
-                [str(entry) for entry in self.memory_entries]
-            )
-        elif len(self.memory_entries) > 5:
-            previous_entries = "previous memory entries:\n\n".join(
-                [str(entry) for entry in self.memory_entries[-5:]]
-            )
-        else:
-            previous_entries = "No previous memory entries"
+        previous_entries = self._format_previous_entries()
 
         prompt = f"""
             grade the importance of the following event on a scale from 1 to 5:
@@ -89,8 +161,7 @@ class EpisodicMemory(Memory):
             response_format=EventGrade,
         )
 
-        formatted_response = json.loads(rsp.choices[0].message.content)
-        return formatted_response["grade"]
+        return EventGrade.model_validate_json(rsp.choices[0].message.content).grade
 
     def retrieve_top_k_entries(self, k: int) -> list[MemoryEntry]:
         """
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from rich.console import Console
@@ -17,11 +17,17 @@ class MemoryEntry:
     step: int
     agent: "LLMAgent"
 
+    # Lazily cached result of __str__; entries are formatted once but can be
+    # stringified many times (memory prompts, grading context, display)
+    _formatted: str | None = field(default=None, repr=False, compare=False)
+
     def __str__(self) -> str:
         """
         Format the memory entry as a string.
         Note : 'content' is a dict that can have nested dictionaries of arbitrary depth
         """
+        if self._formatted is not None:
+            return self._formatted
 
         def format_nested_dict(data, indent_level=0):
             lines = []
@@ -51,6 +57,7 @@ class MemoryEntry:
 
         content = "\n".join(lines)
 
+        self._formatted = content
         return content
 
     def display(self):
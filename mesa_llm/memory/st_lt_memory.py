@@ -55,6 +55,10 @@ class STLTMemory(Memory):
 
         self.short_term_memory = deque()
         self.long_term_memory = ""
+
+        # Cached formatted views, rebuilt lazily after the memory changes
+        self._fmt_short_term: tuple[int, str] | None = None
+        self._fmt_long_term: tuple[object, str] | None = None
         self.system_prompt = """
             You are a helpful assistant that summarizes the short term memory into a long term memory.
             The long term memory should be a summary of the short term memory that is concise and informative.
@@ -88,6 +92,8 @@ class STLTMemory(Memory):
         - Consolidate the memory if the short term memory is over capacity
         - Display the new entry
         """
+        # The short term memory is mutated below, so the cached view is stale
+        self._fmt_short_term = None
 
         # Add the new entry to the short term memory
         if pre_step:
@@ -132,14 +138,24 @@ class STLTMemory(Memory):
         """
         Get the long term memory
         """
-        return str(self.long_term_memory)
+        # Re-stringify only when the long term memory has been replaced
+        if self._fmt_long_term is None or self._fmt_long_term[0] is not (
+            self.long_term_memory
+        ):
+            self._fmt_long_term = (self.long_term_memory, str(self.long_term_memory))
+        return self._fmt_long_term[1]
 
     def format_short_term(self) -> str:
         """
         Get the short term memory
         """
+        if self._fmt_short_term is not None and self._fmt_short_term[0] == len(
+            self.short_term_memory
+        ):
+            return self._fmt_short_term[1]
+
         if not self.short_term_memory:
-            return "No recent memory."
+            formatted = "No recent memory."
 
         else:
             lines = []
@@ -147,7 +163,10 @@ class STLTMemory(Memory):
                 lines.append(
                     f"Step {st_memory_entry.step}: \n{st_memory_entry.content}"
                 )
-            return "\n".join(lines)
+            formatted = "\n".join(lines)
+
+        self._fmt_short_term = (len(self.short_term_memory), formatted)
+        return formatted
 
     def get_prompt_ready(self) -> str:
         return [
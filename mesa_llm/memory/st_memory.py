@@ -31,12 +31,17 @@ class ShortTermMemory(Memory):
         self.n = n
         self.short_term_memory = deque()
 
+        # Cached formatted view, rebuilt lazily after the memory changes
+        self._fmt_short_term: tuple[int, str] | None = None
+
     def process_step(self, pre_step: bool = False):
         """
         Process the step of the agent :
         - Add the new entry to the short term memory
         - Display the new entry
         """
+        # The short term memory is mutated below, so the cached view is stale
+        self._fmt_short_term = None
 
         # Add the new entry to the short term memory
         if pre_step:
@@ -69,8 +74,13 @@ class ShortTermMemory(Memory):
         """
         Get the short term memory
         """
+        if self._fmt_short_term is not None and self._fmt_short_term[0] == len(
+            self.short_term_memory
+        ):
+            return self._fmt_short_term[1]
+
         if not self.short_term_memory:
-            return "No recent memory."
+            formatted = "No recent memory."
 
         else:
             lines = []
@@ -78,7 +88,10 @@ class ShortTermMemory(Memory):
                 lines.append(
                     f"Step {st_memory_entry.step}: \n{st_memory_entry.content}"
                 )
-            return "\n".join(lines)
+            formatted = "\n".join(lines)
+
+        self._fmt_short_term = (len(self.short_term_memory), formatted)
+        return formatted
 
     def get_prompt_ready(self) -> str:
         return f"Short term memory:\n {self.format_short_term()}\n"
@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING
 from mesa.agent import Agent, AgentSet
 
 if TYPE_CHECKING:
+    from mesa.model import Model
+
     from .llm_agent import LLMAgent
 
 # Global variable to control parallel stepping mode
@@ -28,6 +30,16 @@ async def step_agents_parallel(agents: list[Agent | LLMAgent]) -> None:
     await asyncio.gather(*tasks)
 
 
+async def astep_all(model: Model) -> None:
+    """
+    Step all of a model's agents concurrently in a single asyncio.gather so
+    that their LLM round-trips overlap instead of running back to back.
+    Intended for models that drive their own stepping loop rather than going
+    through AgentSet.shuffle_do.
+    """
+    await step_agents_parallel(list(model.agents))
+
+
 async def _sync_step(agent: Agent) -> None:
     """Run synchronous step in async context."""
     agent.step()
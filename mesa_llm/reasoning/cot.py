@@ -5,36 +5,10 @@ from mesa_llm.reasoning.reasoning import Observation, Plan, Reasoning
 if TYPE_CHECKING:
     from mesa_llm.llm_agent import LLMAgent
 
-
-class CoTReasoning(Reasoning):
-    """
-    Use a chain of thought approach to decide the next action.
-    """
-
-    def __init__(self, agent: "LLMAgent"):
-        super().__init__(agent=agent)
-
-    def get_cot_system_prompt(self, obs: Observation) -> str:
-        memory = getattr(self.agent, "memory", None)
-        long_term_memory = ""
-        if (
-            memory
-            and hasattr(memory, "format_long_term")
-            and callable(memory.format_long_term)
-        ):
-            long_term_memory = memory.format_long_term()
-
-        short_term_memory = ""
-        if (
-            memory
-            and hasattr(memory, "format_short_term")
-            and callable(memory.format_short_term)
-        ):
-            short_term_memory = memory.format_short_term()
-
-        obs_str = str(obs)
-
-        system_prompt = f"""
+# Precompiled template filled with (long-term memory, short-term memory,
+# observation) on every plan call; %-substitution into a pre-built template is
+# cheaper than rebuilding the large f-string each step
+_COT_SYSTEM_PROMPT_TEMPLATE = """
         You are an autonomous agent operating in a simulation.
         Use a detailed step-by-step reasoning process (Chain-of-Thought) to decide your next action.
         Your memory contains information from past experiences, and your observation provides the current context.
@@ -42,17 +16,17 @@ class CoTReasoning(Reasoning):
         ---
 
         # Long-Term Memory
-        {long_term_memory}
+        %s
 
         ---
 
         # Short-Term Memory (Recent History)
-        {short_term_memory}
+        %s
 
         ---
 
         # Current Observation
-        {obs_str}
+        %s
 
         ---
 
@@ -69,7 +43,41 @@ class CoTReasoning(Reasoning):
 
 
         """
-        return system_prompt
+
+
+class CoTReasoning(Reasoning):
+    """
+    Use a chain of thought approach to decide the next action.
+    """
+
+    def __init__(self, agent: "LLMAgent"):
+        super().__init__(agent=agent)
+
+    def get_cot_system_prompt(self, obs: Observation) -> str:
+        memory = getattr(self.agent, "memory", None)
+        long_term_memory = ""
+        if (
+            memory
+            and hasattr(memory, "format_long_term")
+            and callable(memory.format_long_term)
+        ):
+            long_term_memory = memory.format_long_term()
+
+        short_term_memory = ""
+        if (
+            memory
+            and hasattr(memory, "format_short_term")
+            and callable(memory.format_short_term)
+        ):
+            short_term_memory = memory.format_short_term()
+
+        obs_str = str(obs)
+
+        return _COT_SYSTEM_PROMPT_TEMPLATE % (
+            long_term_memory,
+            short_term_memory,
+            obs_str,
+        )
 
     def plan(
         self,
@@ -1,4 +1,5 @@
-import json
+import hashlib
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
@@ -14,12 +15,8 @@ class ReActOutput(BaseModel):
     action: str
 
 
-class ReActReasoning(Reasoning):
-    def __init__(self, agent: "LLMAgent"):
-        super().__init__(agent=agent)
-
-    def get_react_system_prompt(self) -> str:
-        system_prompt = """
+# Built once at import; the ReAct system prompt has no per-step variables
+_REACT_SYSTEM_PROMPT = """
         You are an autonomous agent in a simulation environment.
         You can think about your situation and describe your plan.
         Use your short-term and/or long-term memory to guide your behavior.
@@ -32,7 +29,39 @@ class ReActReasoning(Reasoning):
         action: [The action you decide to take - Do NOT use any tools here, just describe the action you will take]
 
         """
-        return system_prompt
+
+# Pre-built no-op message for plans that have nothing to act on; mirrors the
+# (content, tool_calls) shape of an LLM response message so apply_plan and the
+# tool manager handle it like any other plan
+_EMPTY_PLAN_MESSAGE = SimpleNamespace(content="", tool_calls=None)
+
+
+class ReActReasoning(Reasoning):
+    def __init__(self, agent: "LLMAgent", cache_enabled: bool = True):
+        super().__init__(agent=agent)
+        self.cache_enabled = cache_enabled
+        # Single-entry cache: the prompt content embeds step-bearing text
+        # (observation repr, short-term memory lines), so only back-to-back
+        # identical situations can ever produce the same key
+        self._last_plan_key: str | None = None
+        self._last_plan: Plan | None = None
+
+    @staticmethod
+    def _cache_key(
+        system_prompt: str,
+        prompt_list: list[str],
+        selected_tools: list[str] | None,
+    ) -> str:
+        """
+        Hash the full LLM input (system prompt, user prompts and tool
+        selection) so an identical planning situation can reuse the previous
+        plan.
+        """
+        content = "\n".join([system_prompt, *prompt_list, *(selected_tools or ())])
+        return hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()
+
+    def get_react_system_prompt(self) -> str:
+        return _REACT_SYSTEM_PROMPT
 
     def get_react_prompt(self, obs: Observation) -> list[str]:
         prompt_list = self.agent.memory.get_prompt_ready()
@@ -71,7 +100,21 @@ class ReActReasoning(Reasoning):
             selected_tools
         )
 
+        # No tools to call and nothing observed: there is nothing a plan could
+        # act on, so skip the LLM round-trips entirely
+        if not selected_tools_schema and obs is not None and not obs.local_state:
+            return Plan(step=obs.step, llm_plan=_EMPTY_PLAN_MESSAGE, ttl=ttl)
+
         # ---------------- generate the plan ----------------
+        cache_key = self._cache_key(
+            self.agent.llm.system_prompt, prompt_list, selected_tools
+        )
+
+        # Identical planning input (memory, observation and prompt) as the
+        # previous call: the situation has not changed, reuse the previous plan
+        if self.cache_enabled and cache_key == self._last_plan_key:
+            return self._last_plan
+
         rsp = self.agent.llm.generate(
             prompt=prompt_list,
             tool_schema=selected_tools_schema,
@@ -79,14 +122,17 @@ class ReActReasoning(Reasoning):
             response_format=ReActOutput,
         )
 
-        formatted_response = json.loads(rsp.choices[0].message.content)
+        # Single pydantic-core parse straight into the response model
+        react_output = ReActOutput.model_validate_json(rsp.choices[0].message.content)
 
-        self.agent.memory.add_to_memory(type="plan", content=formatted_response)
+        self.agent.memory.add_to_memory(type="plan", content=react_output.model_dump())
 
         # ---------------- execute the plan ----------------
-        react_plan = self.execute_tool_call(
-            formatted_response["action"], selected_tools
-        )
+        react_plan = self.execute_tool_call(react_output.action, selected_tools)
+
+        if self.cache_enabled:
+            self._last_plan_key = cache_key
+            self._last_plan = react_plan
 
         return react_plan
 
@@ -116,7 +162,20 @@ class ReActReasoning(Reasoning):
             selected_tools
         )
 
+        # No tools to call and nothing observed: there is nothing a plan could
+        # act on, so skip the LLM round-trips entirely
+        if not selected_tools_schema and obs is not None and not obs.local_state:
+            return Plan(step=obs.step, llm_plan=_EMPTY_PLAN_MESSAGE, ttl=ttl)
+
         # ---------------- generate the plan ----------------
+        cache_key = self._cache_key(
+            self.agent.llm.system_prompt, prompt_list, selected_tools
+        )
+
+        # Identical planning input (memory, observation and prompt) as the
+        # previous call: the situation has not changed, reuse the previous plan
+        if self.cache_enabled and cache_key == self._last_plan_key:
+            return self._last_plan
 
         rsp = await self.agent.llm.agenerate(
             prompt=prompt_list,
@@ -125,13 +184,20 @@ class ReActReasoning(Reasoning):
             response_format=ReActOutput,
         )
 
-        formatted_response = json.loads(rsp.choices[0].message.content)
+        # Single pydantic-core parse straight into the response model
+        react_output = ReActOutput.model_validate_json(rsp.choices[0].message.content)
 
-        self.agent.memory.add_to_memory(type="plan", content=formatted_response)
+        # The memory write must finish before the executor call starts:
+        # LLM-backed memories (e.g. EpisodicMemory grading) and
+        # aexecute_tool_call both go through the shared ModuleLLM, whose
+        # system_prompt is read at call time
+        self.agent.memory.add_to_memory(type="plan", content=react_output.model_dump())
 
         # ---------------- execute the plan ----------------
-        react_plan = await self.aexecute_tool_call(
-            formatted_response["action"], selected_tools
-        )
+        react_plan = await self.aexecute_tool_call(react_output.action, selected_tools)
+
+        if self.cache_enabled:
+            self._last_plan_key = cache_key
+            self._last_plan = react_plan
 
         return react_plan
@@ -9,38 +9,10 @@ from mesa_llm.reasoning.reasoning import (
 if TYPE_CHECKING:
     from mesa_llm.llm_agent import LLMAgent
 
-
-class ReWOOReasoning(Reasoning):
-    """
-    ReWOO is a reasoning approach that creates a plan that can be executed without needing new observations.
-    """
-
-    def __init__(self, agent: "LLMAgent"):
-        super().__init__(agent=agent)
-        self.remaining_tool_calls = 0  # Initialize remaining tool calls
-        self.current_plan: Plan | None = None
-        self.current_obs: Observation | None = None
-
-    def get_rewoo_system_prompt(self, obs: Observation) -> str:
-        memory = getattr(self.agent, "memory", None)
-
-        long_term_memory = ""
-        if (
-            memory
-            and hasattr(memory, "format_long_term")
-            and callable(memory.format_long_term)
-        ):
-            long_term_memory = memory.format_long_term()
-
-        short_term_memory = ""
-        if (
-            memory
-            and hasattr(memory, "format_short_term")
-            and callable(memory.format_short_term)
-        ):
-            short_term_memory = memory.format_short_term()
-
-        system_prompt = f"""
+# Precompiled template filled with (long-term memory, short-term memory,
+# observation) on every plan call; %-substitution into a pre-built template is
+# cheaper than rebuilding the large f-string each step
+_REWOO_SYSTEM_PROMPT_TEMPLATE = """
         You are an autonomous agent that creates multi-step plans without re-observing during execution.
         Using the ReWOO (Reasoning WithOut Observation) approach, you will create a comprehensive plan
         that anticipates multiple steps ahead based on your current observation and memory.
@@ -48,17 +20,17 @@ class ReWOOReasoning(Reasoning):
         ---
 
         # Long-Term Memory
-        {long_term_memory}
+        %s
 
         ---
 
         # Short-Term Memory (Recent History)
-        {short_term_memory}
+        %s
 
         ---
 
         # Current Observation
-        {self.current_obs}
+        %s
 
         ---
 
@@ -86,7 +58,43 @@ class ReWOOReasoning(Reasoning):
 
         ---
         """
-        return system_prompt
+
+
+class ReWOOReasoning(Reasoning):
+    """
+    ReWOO is a reasoning approach that creates a plan that can be executed without needing new observations.
+    """
+
+    def __init__(self, agent: "LLMAgent"):
+        super().__init__(agent=agent)
+        self.remaining_tool_calls = 0  # Initialize remaining tool calls
+        self.current_plan: Plan | None = None
+        self.current_obs: Observation | None = None
+
+    def get_rewoo_system_prompt(self, obs: Observation) -> str:
+        memory = getattr(self.agent, "memory", None)
+
+        long_term_memory = ""
+        if (
+            memory
+            and hasattr(memory, "format_long_term")
+            and callable(memory.format_long_term)
+        ):
+            long_term_memory = memory.format_long_term()
+
+        short_term_memory = ""
+        if (
+            memory
+            and hasattr(memory, "format_short_term")
+            and callable(memory.format_short_term)
+        ):
+            short_term_memory = memory.format_short_term()
+
+        return _REWOO_SYSTEM_PROMPT_TEMPLATE % (
+            long_term_memory,
+            short_term_memory,
+            self.current_obs,
+        )
 
     def plan(
         self,
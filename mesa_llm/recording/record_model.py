@@ -11,7 +11,7 @@ Usage::
 The decorator will:
 1. Instantiate a ``SimulationRecorder`` after the model's original ``__init__`` completes and assign it to ``self.recorder``.
 2. Attach the same recorder to every agent that exposes a ``recorder`` attribute (e.g., subclasses of ``LLMAgent``).
-3. Wrap the model's ``step`` method to automatically record ``step_start`` and ``step_end`` events and ensure late-added agents also receive the recorder.
+3. Wrap the model's ``step`` method to automatically record ``step_start`` and ``step_end`` events; agents registered after initialization receive the recorder when they are registered.
 4. Provide a convenience ``save_recording`` method on the model for persisting the captured simulation events.
 
 Parameters
@@ -26,6 +26,7 @@ Parameters
 """
 
 import atexit
+import weakref
 from collections.abc import Callable
 from functools import wraps
 
@@ -33,6 +34,21 @@ from mesa.model import Model
 
 from mesa_llm.recording.simulation_recorder import SimulationRecorder
 
+# All live recorders share one atexit handler instead of registering a new
+# closure (which would also keep the model alive) per model instance
+_active_recorders: weakref.WeakSet = weakref.WeakSet()
+_atexit_registered = False
+
+
+def _flush_all():
+    """Auto-save every live recorder that still has unsaved events."""
+    for recorder in list(_active_recorders):
+        try:
+            if recorder.events:
+                recorder.save()
+        except Exception as exc:  # pragma: no cover - defensive
+            print(f"[SimulationRecorder] Auto-save failed: {exc}")
+
 
 def _attach_recorder_to_agents(model: Model, recorder: SimulationRecorder):
     """Utility that iterates over all agents and attaches the recorder."""
@@ -64,16 +80,23 @@ def record_model(
         self.recorder = SimulationRecorder(model=self, **recorder_kwargs)  # type: ignore[attr-defined]
         _attach_recorder_to_agents(self, self.recorder)
 
-        # Use a closure to capture a reference to `self`
-        def _auto_save():
-            try:
-                # Avoid creating multiple identical files if already saved manually
-                if hasattr(self, "recorder") and self.recorder.events:
-                    self.save_recording()
-            except Exception as exc:  # pragma: no cover - defensive
-                print(f"[SimulationRecorder] Auto-save failed: {exc}")
+        # Attach the recorder to agents created later at registration time,
+        # instead of rescanning the whole population every step
+        original_register = self.register_agent
+
+        def register_agent_with_recorder(agent):
+            original_register(agent)
+            if hasattr(agent, "recorder"):
+                agent.recorder = self.recorder
+
+        self.register_agent = register_agent_with_recorder
 
-        atexit.register(_auto_save)
+        # Register one shared shutdown flusher for all recorders
+        global _atexit_registered  # noqa: PLW0603
+        _active_recorders.add(self.recorder)
+        if not _atexit_registered:
+            atexit.register(_flush_all)
+            _atexit_registered = True
 
     cls.__init__ = init_wrapper  # type: ignore[assignment]
 
@@ -88,10 +111,9 @@ def record_model(
             # Execute the original step logic
             result = original_step(self, *args, **kwargs)  # type: ignore[misc]
 
-            # Make sure any new agents created during the step also receive the recorder
+            # Record end of step after agents have acted; agents created during
+            # the step already received the recorder at registration time
             if hasattr(self, "recorder"):
-                _attach_recorder_to_agents(self, self.recorder)  # type: ignore[attr-defined]
-                # Record end of step after agents have acted
                 self.recorder.record_model_event("step_end", {"step": self.steps})  # type: ignore[attr-defined]
 
             return result
@@ -7,6 +7,7 @@ including agent observations, plans, actions, messages, and state changes.
 
 import json
 import pickle
+import sys
 import uuid
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
@@ -14,9 +15,13 @@ from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationEvent:
-    """A single recorded event in the simulation."""
+    """A single recorded event in the simulation.
+
+    Uses ``slots`` since one event is created per hot-path call (observations,
+    plans, actions, messages) and recordings can hold many thousands of them.
+    """
 
     event_id: str
     timestamp: datetime
@@ -87,21 +92,14 @@ class SimulationRecorder:
 
         # Handle different content formats based on event type
         if event_type == "message":
-            if isinstance(content, str | dict | list):
-                formatted_content = {
-                    "message": content,
-                    "recipient_ids": recipient_ids or [],
-                }
-            else:
-                formatted_content = {
-                    "message": content,
-                    "recipient_ids": recipient_ids or [],
-                }
+            formatted_content = {
+                "message": content,
+                "recipient_ids": recipient_ids or [],
+            }
+        elif isinstance(content, dict):
+            formatted_content = content
         else:
-            if isinstance(content, dict):
-                formatted_content = content
-            else:
-                formatted_content = {"data": content}
+            formatted_content = {"data": content}
 
         # Create the event
         event_id = f"{self.simulation_id}_{len(self.events):06d}"
@@ -111,7 +109,9 @@ class SimulationRecorder:
             timestamp=datetime.now(UTC),
             step=self.model.steps,
             agent_id=agent_id,
-            event_type=event_type,
+            # Event types come from a small fixed vocabulary; interning keeps
+            # one shared string per type across the whole recording
+            event_type=sys.intern(event_type),
             content=formatted_content,
             metadata=metadata,
         )
@@ -99,15 +99,20 @@ def speak_to(
         and listener_agent.unique_id != agent.unique_id
     ]
 
+    # Build the content once and hand each listener a shallow copy, since some
+    # memories (e.g. EpisodicMemory) mutate the dict they receive
+    recipient_ids = [listener_agent.unique_id for listener_agent in listener_agents]
+    content = {
+        "message": message,
+        "sender": agent.unique_id,
+        "recipients": recipient_ids,
+    }
     for recipient in listener_agents:
-        recipient.memory.add_to_memory(
-            type="message",
-            content={
-                "message": message,
-                "sender": agent.unique_id,
-                "recipients": [
-                    listener_agent.unique_id for listener_agent in listener_agents
-                ],
-            },
-        )
-    return f"{agent.unique_id} → {[agent.unique_id for agent in listener_agents]} : {message}"
+        recipient.memory.add_to_memory(type="message", content=dict(content))
+    return f"{agent.unique_id} → {recipient_ids} : {message}"
+
+
+# Explicit list of the tools defined in this module. Kept static (rather than
+# discovered through introspection) so importing the module stays cheap and no
+# imported helper is exported by accident.
+inbuilt_tools = [move_one_step, teleport_to_location, speak_to]
@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 import json
 from collections.abc import Callable
@@ -7,6 +8,12 @@ from terminal_style import sprint, style
 
 from mesa_llm.tools.tool_decorator import _GLOBAL_TOOL_REGISTRY, add_tool_callback
 
+try:
+    # Optional Rust JSON codec; arguments are parsed once per tool call
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 if TYPE_CHECKING:
     from mesa_llm.llm_agent import LLMAgent
 
@@ -30,10 +37,14 @@ class ToolManager:
         if extra_tools:
             self.tools.update(extra_tools)
 
+        # Schemas cached per selection of tools; cleared when tools change
+        self._schema_cache: dict[tuple[str, ...] | None, list[dict]] = {}
+
     def register(self, fn: Callable):
         """Register a tool function by name"""
         name = fn.__name__
         self.tools[name] = fn  # storing the name & function pair as a dictionary
+        self._schema_cache.clear()
 
     @classmethod
     def add_tool_to_all(cls, fn: Callable):
@@ -49,14 +60,21 @@ class ToolManager:
     def get_all_tools_schema(
         self, selected_tools: list[str] | None = None
     ) -> list[dict]:
+        key = tuple(selected_tools) if selected_tools else None
+        cached = self._schema_cache.get(key)
+        if cached is not None:
+            return cached
+
         if selected_tools:
             selected_tools_schema = [
                 self.tools[tool].__tool_schema__ for tool in selected_tools
             ]
-            return selected_tools_schema
 
         else:
-            return [fn.__tool_schema__ for fn in self.tools.values()]
+            selected_tools_schema = [fn.__tool_schema__ for fn in self.tools.values()]
+
+        self._schema_cache[key] = selected_tools_schema
+        return selected_tools_schema
 
     def call(self, name: str, arguments: dict) -> str:
         """Call a registered tool with validated args"""
@@ -83,114 +101,148 @@ class ToolManager:
             # Extract response message and tool calls
             tool_calls = llm_response.tool_calls
 
-            # Check if tool_calls exists and is not None
+            # A message without tool calls is a valid no-op plan (e.g. the
+            # idle fast path in ReActReasoning), not an error
             if not tool_calls:
-                sprint("No tool calls in LLM response", color="red")
                 return []
 
-            tool_results = []
-
             # Process each tool call
-            for i, tool_call in enumerate(tool_calls):
-                try:
-                    # Extract function details
-                    function_name = tool_call.function.name
-                    function_args_str = tool_call.function.arguments
-                    tool_call_id = tool_call.id
-
-                    # Validate function exists in tool_manager
-                    if function_name not in self.tools:
-                        raise ValueError(
-                            style(
-                                f"Function '{function_name}' not found in ToolManager",
-                                color="red",
-                            )
-                        )
-
-                    # Parse function arguments
-                    try:
-                        function_args = json.loads(function_args_str)
-                    except json.JSONDecodeError as e:
-                        raise json.JSONDecodeError(
-                            style(
-                                f"Invalid JSON in function arguments: {e}", color="red"
-                            )
-                        ) from e
-
-                    # Get the actual function to call from tool_manager
-                    function_to_call = self.tools[function_name]
-
-                    # Call the function with unpacked arguments
-                    try:
-                        function_response = function_to_call(
-                            agent=agent, **function_args
-                        )
-                    except TypeError as e:
-                        # If function arguments don't match function signature :
-                        sprint(
-                            f"Warning: Function call failed with TypeError: {e}",
-                            color="yellow",
-                        )
-                        sprint(
-                            "Attempting to call with filtered arguments...",
-                            color="yellow",
-                        )
-
-                        # Try to filter arguments to match function signature
-
-                        sig = inspect.signature(function_to_call)
-                        expects_agent = "agent" in sig.parameters
-                        filtered_args = {
-                            k: v
-                            for k, v in function_args.items()
-                            if k in sig.parameters
-                        }
-
-                        if expects_agent:
-                            function_response = function_to_call(
-                                agent=agent, **filtered_args
-                            )
-                        else:
-                            function_response = function_to_call(**filtered_args)
-
-                    if not function_response:
-                        function_response = f"{function_name} executed successfully"
-
-                    # Create tool result message
-                    tool_result = {
-                        "tool_call_id": tool_call_id,
-                        "role": "tool",
-                        "name": function_name,
-                        "response": str(function_response),
-                    }
-
-                    tool_results.append(tool_result)
-
-                except Exception as e:
-                    # Handle individual tool call errors
-                    sprint(
-                        f"Error executing tool call {i + 1} ({function_name}): {e!s}",
-                        color="red",
-                    )
+            return [
+                self._execute_tool_call(agent, i, tool_call)
+                for i, tool_call in enumerate(tool_calls)
+            ]
+
+        except AttributeError as e:
+            sprint(f"Error accessing LLM response structure: {e}", color="red")
+            return []
+        except Exception as e:
+            sprint(f"Unexpected error in call_tools: {e}", color="red")
+            return []
+
+    async def acall_tools(self, agent: "LLMAgent", llm_response: Any) -> list[dict]:
+        """
+        Asynchronous version of call_tools() that executes independent tool
+        calls concurrently in worker threads. Results keep the same order as
+        the tool calls in the LLM response.
+        """
+        try:
+            tool_calls = llm_response.tool_calls
 
-                    # Create error response
-                    error_result = {
-                        "tool_call_id": tool_call.id,
-                        "role": "tool",
-                        "name": function_name,
-                        "response": f"Error: {e!s}",
-                    }
+            if not tool_calls:
+                return []
 
-                    tool_results.append(error_result)
-            return tool_results
+            return list(
+                await asyncio.gather(
+                    *(
+                        asyncio.to_thread(self._execute_tool_call, agent, i, tool_call)
+                        for i, tool_call in enumerate(tool_calls)
+                    )
+                )
+            )
 
         except AttributeError as e:
             sprint(f"Error accessing LLM response structure: {e}", color="red")
             return []
         except Exception as e:
-            sprint(f"Unexpected error in call_tools: {e}", color="red")
+            sprint(f"Unexpected error in acall_tools: {e}", color="red")
             return []
 
+    def _execute_tool_call(self, agent: "LLMAgent", i: int, tool_call: Any) -> dict:
+        """
+        Execute a single tool call and return its result message.
+
+        Args:
+            agent: The agent the tool call is executed for.
+            i: Index of the tool call in the LLM response (used in error messages).
+            tool_call: The tool call object from the LLM response.
+
+        Returns:
+            A tool result dict, or an error dict if execution failed.
+        """
+        try:
+            # Extract function details
+            function_name = tool_call.function.name
+            function_args_str = tool_call.function.arguments
+            tool_call_id = tool_call.id
+
+            # Validate function exists in tool_manager
+            if function_name not in self.tools:
+                raise ValueError(
+                    style(
+                        f"Function '{function_name}' not found in ToolManager",
+                        color="red",
+                    )
+                )
+
+            # Parse function arguments
+            # (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+            try:
+                function_args = (
+                    orjson.loads(function_args_str)
+                    if orjson is not None
+                    else json.loads(function_args_str)
+                )
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(
+                    style(f"Invalid JSON in function arguments: {e}", color="red")
+                ) from e
+
+            # Get the actual function to call from tool_manager
+            function_to_call = self.tools[function_name]
+
+            # Call the function with unpacked arguments
+            try:
+                function_response = function_to_call(agent=agent, **function_args)
+            except TypeError as e:
+                # If function arguments don't match function signature :
+                sprint(
+                    f"Warning: Function call failed with TypeError: {e}",
+                    color="yellow",
+                )
+                sprint(
+                    "Attempting to call with filtered arguments...",
+                    color="yellow",
+                )
+
+                # Try to filter arguments to match function signature
+
+                sig = inspect.signature(function_to_call)
+                expects_agent = "agent" in sig.parameters
+                filtered_args = {
+                    k: v for k, v in function_args.items() if k in sig.parameters
+                }
+
+                if expects_agent:
+                    function_response = function_to_call(agent=agent, **filtered_args)
+                else:
+                    function_response = function_to_call(**filtered_args)
+
+            if not function_response:
+                function_response = f"{function_name} executed successfully"
+
+            # Create tool result message
+            return {
+                "tool_call_id": tool_call_id,
+                "role": "tool",
+                "name": function_name,
+                "response": str(function_response),
+            }
+
+        except Exception as e:
+            # Handle individual tool call errors
+            sprint(
+                f"Error executing tool call {i + 1} ({function_name}): {e!s}",
+                color="red",
+            )
+
+            # Create error response
+            return {
+                "tool_call_id": tool_call.id,
+                "role": "tool",
+                "name": function_name,
+                "response": f"Error: {e!s}",
+            }
+
 
 # Register callback to automatically add new tools to all ToolManager instances
 add_tool_callback(ToolManager.add_tool_to_all)
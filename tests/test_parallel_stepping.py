@@ -5,6 +5,7 @@ from mesa.agent import Agent, AgentSet
 from mesa.model import Model
 
 from mesa_llm.parallel_stepping import (
+    astep_all,
     disable_automatic_parallel_stepping,
     enable_automatic_parallel_stepping,
     step_agents_multithreaded,
@@ -47,6 +48,16 @@ async def test_step_agents_parallel():
     assert a2.counter == 1
 
 
+@pytest.mark.asyncio
+async def test_astep_all():
+    m = DummyModel()
+    a1 = SyncAgent(m)
+    a2 = AsyncAgent(m)
+    await astep_all(m)
+    assert a1.counter == 1
+    assert a2.counter == 1
+
+
 def test_step_agents_multithreaded():
     m = DummyModel()
     a1 = SyncAgent(m)
@@ -82,7 +82,9 @@ class TestReActReasoning:
         mock_agent.memory.add_to_memory = Mock()
         mock_agent.llm = Mock()
         mock_agent.tool_manager = Mock()
-        mock_agent.tool_manager.get_all_tools_schema.return_value = {}
+        mock_agent.tool_manager.get_all_tools_schema.return_value = [
+            {"type": "function", "function": {"name": "test_tool"}}
+        ]
 
         # Mock the LLM response
         mock_response = Mock()
@@ -113,7 +115,9 @@ class TestReActReasoning:
         mock_agent.memory.add_to_memory = Mock()
         mock_agent.llm = Mock()
         mock_agent.tool_manager = Mock()
-        mock_agent.tool_manager.get_all_tools_schema.return_value = {}
+        mock_agent.tool_manager.get_all_tools_schema.return_value = [
+            {"type": "function", "function": {"name": "test_tool"}}
+        ]
 
         # Mock the LLM response
         mock_response = Mock()
@@ -138,6 +142,123 @@ class TestReActReasoning:
             "test_action", selected_tools
         )
 
+    def test_plan_caches_identical_prompts(self):
+        """Test that a repeated identical planning situation skips the LLM call."""
+        mock_agent = Mock()
+        mock_agent.memory = Mock()
+        mock_agent.memory.get_prompt_ready.side_effect = lambda: ["memory1"]
+        mock_agent.memory.get_communication_history.return_value = ""
+        mock_agent.memory.add_to_memory = Mock()
+        mock_agent.llm = Mock()
+        mock_agent.tool_manager = Mock()
+        mock_agent.tool_manager.get_all_tools_schema.return_value = [
+            {"type": "function", "function": {"name": "test_tool"}}
+        ]
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps(
+            {"reasoning": "Cached reasoning", "action": "cached_action"}
+        )
+        mock_agent.llm.generate.return_value = mock_response
+
+        mock_plan = Plan(step=1, llm_plan=Mock())
+        reasoning = ReActReasoning(mock_agent)
+        reasoning.execute_tool_call = Mock(return_value=mock_plan)
+
+        obs = Observation(step=1, self_state={}, local_state={})
+        first = reasoning.plan(obs=obs, prompt="Custom prompt")
+        second = reasoning.plan(obs=obs, prompt="Custom prompt")
+
+        # Second call reuses the previous plan instead of the LLM
+        mock_agent.llm.generate.assert_called_once()
+        reasoning.execute_tool_call.assert_called_once()
+        assert second is first
+
+    def test_plan_cache_distinguishes_selected_tools(self):
+        """Test that a different tool selection does not reuse the cached plan."""
+        mock_agent = Mock()
+        mock_agent.memory = Mock()
+        mock_agent.memory.get_prompt_ready.side_effect = lambda: ["memory1"]
+        mock_agent.memory.get_communication_history.return_value = ""
+        mock_agent.memory.add_to_memory = Mock()
+        mock_agent.llm = Mock()
+        mock_agent.tool_manager = Mock()
+        mock_agent.tool_manager.get_all_tools_schema.return_value = [
+            {"type": "function", "function": {"name": "test_tool"}}
+        ]
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps(
+            {"reasoning": "Tool-dependent reasoning", "action": "some_action"}
+        )
+        mock_agent.llm.generate.return_value = mock_response
+
+        mock_plan = Plan(step=1, llm_plan=Mock())
+        reasoning = ReActReasoning(mock_agent)
+        reasoning.execute_tool_call = Mock(return_value=mock_plan)
+
+        obs = Observation(step=1, self_state={}, local_state={})
+        reasoning.plan(obs=obs, prompt="Custom prompt", selected_tools=["tool_a"])
+        reasoning.plan(obs=obs, prompt="Custom prompt", selected_tools=["tool_b"])
+
+        # The tool selection is part of the cache key, so neither the response
+        # cache nor the previous plan may be reused
+        assert mock_agent.llm.generate.call_count == 2
+        assert reasoning.execute_tool_call.call_count == 2
+
+    def test_plan_empty_fast_path(self):
+        """Test plan returns a no-op plan without the LLM when there is nothing to do."""
+        mock_agent = Mock()
+        mock_agent.memory = Mock()
+        mock_agent.memory.get_prompt_ready.return_value = ["memory1"]
+        mock_agent.memory.get_communication_history.return_value = ""
+        mock_agent.llm = Mock()
+        mock_agent.tool_manager = Mock()
+        mock_agent.tool_manager.get_all_tools_schema.return_value = []
+
+        reasoning = ReActReasoning(mock_agent)
+        reasoning.execute_tool_call = Mock()
+
+        obs = Observation(step=3, self_state={}, local_state={})
+        result = reasoning.plan(obs=obs, prompt="Custom prompt")
+
+        assert result.step == 3
+        assert result.llm_plan.tool_calls is None
+        mock_agent.llm.generate.assert_not_called()
+        reasoning.execute_tool_call.assert_not_called()
+
+    def test_plan_cache_disabled(self):
+        """Test that cache_enabled=False always calls the LLM."""
+        mock_agent = Mock()
+        mock_agent.memory = Mock()
+        mock_agent.memory.get_prompt_ready.return_value = ["memory1"]
+        mock_agent.memory.get_communication_history.return_value = ""
+        mock_agent.memory.add_to_memory = Mock()
+        mock_agent.llm = Mock()
+        mock_agent.tool_manager = Mock()
+        mock_agent.tool_manager.get_all_tools_schema.return_value = [
+            {"type": "function", "function": {"name": "test_tool"}}
+        ]
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps(
+            {"reasoning": "Fresh reasoning", "action": "fresh_action"}
+        )
+        mock_agent.llm.generate.return_value = mock_response
+
+        mock_plan = Plan(step=1, llm_plan=Mock())
+        reasoning = ReActReasoning(mock_agent, cache_enabled=False)
+        reasoning.execute_tool_call = Mock(return_value=mock_plan)
+
+        obs = Observation(step=1, self_state={}, local_state={})
+        reasoning.plan(obs=obs, prompt="Custom prompt")
+        reasoning.plan(obs=obs, prompt="Custom prompt")
+
+        assert mock_agent.llm.generate.call_count == 2
+
     def test_plan_no_prompt_error(self):
         """Test plan method raises error when no prompt is provided."""
         mock_agent = Mock()
@@ -164,7 +285,9 @@ class TestReActReasoning:
         mock_agent.memory.add_to_memory = Mock()
         mock_agent.llm = Mock()
         mock_agent.tool_manager = Mock()
-        mock_agent.tool_manager.get_all_tools_schema.return_value = {}
+        mock_agent.tool_manager.get_all_tools_schema.return_value = [
+            {"type": "function", "function": {"name": "test_tool"}}
+        ]
 
         # Mock the async LLM response
         mock_response = Mock()
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 import pytest
 from mesa.model import Model
 
+import mesa_llm.recording.record_model as record_model_module
 from mesa_llm.recording.record_model import _attach_recorder_to_agents, record_model
 from mesa_llm.recording.simulation_recorder import SimulationRecorder
 
@@ -235,9 +236,26 @@ class TestRecordModelDecorator:
         assert result is None  # This is expected behavior with Mesa
         assert model.test_steps == 1  # Our custom logic executed
 
+    def test_recorder_attached_on_agent_registration(self, temp_dir):
+        """Test that agents registered after init receive the recorder."""
+
+        @record_model(output_dir=str(temp_dir))
+        class SimpleModel(Model):
+            def __init__(self):
+                super().__init__()
+                self.steps = 0
+
+        model = SimpleModel()
+
+        late_agent = Mock()
+        late_agent.recorder = None
+        model.register_agent(late_agent)
+
+        assert late_agent.recorder == model.recorder
+
     @patch("mesa_llm.recording.record_model.atexit.register")
     def test_atexit_registration(self, mock_atexit, temp_dir):
-        """Test that auto-save is registered with atexit."""
+        """Test that a single shared auto-save flusher is registered with atexit."""
 
         @record_model(output_dir=str(temp_dir))
         class SimpleModel(Model):
@@ -245,10 +263,16 @@ class TestRecordModelDecorator:
                 super().__init__()
                 self.steps = 0
 
-        SimpleModel()
+        # Reset the module-level guard so registration happens in this test
+        record_model_module._atexit_registered = False
+
+        model1 = SimpleModel()
+        model2 = SimpleModel()
 
-        # Check that atexit.register was called
-        mock_atexit.assert_called_once()
+        # The flusher is registered exactly once, no matter how many models exist
+        mock_atexit.assert_called_once_with(record_model_module._flush_all)
+        assert model1.recorder in record_model_module._active_recorders
+        assert model2.recorder in record_model_module._active_recorders
 
     def test_multiple_model_classes_independent(self, temp_dir):
         """Test that decorating multiple model classes works independently."""
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import Mock
 
 import pytest
@@ -323,6 +324,42 @@ class TestToolManager:
         assert len(schemas) == 1
         assert schemas[0]["function"]["name"] == "single_tool"
 
+    def test_get_all_tools_schema_cached(self):
+        """Test that schemas are cached and invalidated on registration."""
+
+        @tool
+        def cached_tool(agent, x: int) -> int:
+            """Cached tool.
+            Args:
+                agent: The agent making the request (provided automatically)
+                x: Input.
+            Returns:
+                Output.
+            """
+            return x
+
+        manager = ToolManager()
+
+        schemas1 = manager.get_all_tools_schema()
+        schemas2 = manager.get_all_tools_schema()
+        assert schemas1 is schemas2
+
+        # Registering a new tool clears the cache
+        @tool
+        def another_tool(agent, y: str) -> str:
+            """Another tool.
+            Args:
+                agent: The agent making the request (provided automatically)
+                y: Input.
+            Returns:
+                Output.
+            """
+            return y
+
+        schemas3 = manager.get_all_tools_schema()
+        assert schemas3 is not schemas1
+        assert len(schemas3) == 2
+
     def test_call_tool_success(self):
         """Test successfully calling a tool."""
         manager = ToolManager()
@@ -532,6 +569,51 @@ class TestToolManager:
         assert result[0]["tool_call_id"] == "call_123"
         assert "silent_tool executed successfully" in result[0]["response"]
 
+    def test_acall_tools_preserves_order(self):
+        """Test that acall_tools runs tool calls concurrently but keeps order."""
+        manager = ToolManager()
+
+        @tool
+        def echo_tool(agent, value: str) -> str:
+            """Echo tool.
+            Args:
+                agent: The agent making the request (provided automatically)
+                value: Input value.
+            Returns:
+                The input value.
+            """
+            return f"Echo: {value}"
+
+        mock_agent = Mock()
+
+        tool_calls = []
+        for i in range(3):
+            mock_tool_call = Mock()
+            mock_tool_call.id = f"call_{i}"
+            mock_tool_call.function.name = "echo_tool"
+            mock_tool_call.function.arguments = f'{{"value": "v{i}"}}'
+            tool_calls.append(mock_tool_call)
+
+        mock_response = Mock()
+        mock_response.tool_calls = tool_calls
+
+        result = asyncio.run(manager.acall_tools(mock_agent, mock_response))
+
+        assert len(result) == 3
+        assert [r["tool_call_id"] for r in result] == ["call_0", "call_1", "call_2"]
+        assert [r["response"] for r in result] == ["Echo: v0", "Echo: v1", "Echo: v2"]
+
+    def test_acall_tools_no_tool_calls(self):
+        """Test acall_tools with response that has no tool_calls."""
+        manager = ToolManager()
+        mock_agent = Mock()
+
+        mock_response = Mock()
+        mock_response.tool_calls = None
+
+        result = asyncio.run(manager.acall_tools(mock_agent, mock_response))
+        assert result == []
+
     def test_call_tools_general_exception(self):
         """Test call_tools handling of general exceptions."""
         manager = ToolManager()